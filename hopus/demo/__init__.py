@@ -7,18 +7,19 @@ from importlib import resources
 import pandas as pd
 
 from .. import models
+from ..preprocessing._parquet_cache import CSV_ENGINE
 
 
 def load_training_data() -> pd.DataFrame:
     """Load the demo training data as a `pandas` `DataFrame`."""
     path = resources.files("hopus").joinpath("demo/training_data.csv")
-    return pd.read_csv(path)
+    return pd.read_csv(path, engine=CSV_ENGINE)
 
 
 def load_test_data() -> pd.DataFrame:
     """Load the demo test data as a `pandas` `DataFrame`."""
     path = resources.files("hopus").joinpath("demo/test_data.csv")
-    return pd.read_csv(path)
+    return pd.read_csv(path, engine=CSV_ENGINE)
 
 
 def load_trained_model(kind: str = "BoostedTrees") -> models.Model:
@@ -2,21 +2,26 @@
 This module contains methods used to evaluate the various models.
 """
 
-import secrets
+import math
 
+from joblib import Parallel, delayed
 from sklearn.model_selection import KFold
 
 import numpy as np
 import pandas as pd
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 from . import models
 
 
 def hpi_mse(property_listings: pd.DataFrame, target: str = "price") -> float:
     """
     This method expects a `DataFrame` `property_listings` with the following columns:
-    - `price`, the sale price, or
-    - `logPrice`, the logarithm of the sale price, and
+    - `price`, the sale price (only needed when `target` is `price`),
     - `trueValueHomePriceIndex`, the value of the home price index on the month of
       the sale, and
     - `availableValueHomePriceIndex`, the value of the home price index *available*
@@ -30,18 +35,51 @@ def hpi_mse(property_listings: pd.DataFrame, target: str = "price") -> float:
     The `target` argument is either `price` or `logPrice`, depending on whether
     the error in prices or log-prices is to be computed.
     """
-    truth = property_listings["price"]
-    estimate = property_listings["price"] * (
-        property_listings["availableValueHomePriceIndex"]
-        / property_listings["trueValueHomePriceIndex"]
+    # Work on the underlying `numpy` arrays to avoid the `pandas` overhead
+    # (index alignment, etc.) incurred by each arithmetic operation on a `Series`.
+    # The home price index is stored as `float32` (see `preprocessing`), so it is
+    # converted to `float64` for the errors to be summed in double precision.
+    # The `price` is converted to `float64` as well (with missing values as NaN),
+    # since `numexpr` does not accept the `object` arrays of nullable integer columns.
+    available_value = property_listings["availableValueHomePriceIndex"].to_numpy(
+        dtype=np.float64
     )
+    true_value = property_listings["trueValueHomePriceIndex"].to_numpy(dtype=np.float64)
+
+    # The estimate is `price * available_value / true_value`, hence
+    # - the price error is `price * (1 - available_value / true_value)`, and
+    # - the log-price error is `log(true_value / available_value)`,
+    #   which does not depend on the price at all: in that case neither the `price`
+    #   nor the `logPrice` column is read.
     if target == "logPrice":
-        truth, estimate = np.log(truth), np.log(estimate)
-    error = truth - estimate
-    return np.mean(error**2)
+        price = None
+        expression = "sum(log(t / a) ** 2)"
+    else:
+        price = property_listings["price"].to_numpy(dtype=np.float64, na_value=np.nan)
+        expression = "sum((p * (1 - a / t)) ** 2)"
+
+    # The mean of no errors at all is undefined, whether `numexpr` is installed or not
+    if true_value.size == 0:
+        return float("nan")
 
+    # When `numexpr` is installed, the error and its square are computed, and summed,
+    # in a single pass over the data without allocating intermediate arrays.
+    if numexpr is not None:
+        sum_squared_errors = numexpr.evaluate(
+            expression, local_dict={"p": price, "a": available_value, "t": true_value}
+        )
+        return float(sum_squared_errors) / true_value.size
 
-def hpi_rmse(property_listings: pd.DataFrame, target: str = "price") -> float:
+    if target == "logPrice":
+        error = np.log(true_value / available_value)
+    else:
+        error = price * (1 - available_value / true_value)
+    return float(error.dot(error) / error.size)
+
+
+def hpi_rmse(
+    property_listings: pd.DataFrame, target: str = "price", mse: float = None
+) -> float:
     """
     This method expects a `DataFrame` `property_listings` with the following columns:
     - `price`, the sale price, or
@@ -56,10 +94,69 @@ def hpi_rmse(property_listings: pd.DataFrame, target: str = "price") -> float:
     price index instead of the *true* home price index. This is, roughly speaking,
     a measure of the error coming from using an index with a 3-month lag.
 
+    The `target` argument is either `price` or `logPrice`, depending on whether
+    the error in prices or log-prices is to be computed.
+
+    If the mean squared error was already computed (via `hpi_mse`), it can be passed
+    as `mse` to avoid computing it a second time. For example:
+
+        mse = hpi_mse(property_listings)
+        rmse = hpi_rmse(property_listings, mse=mse)
+    """
+    if mse is None:
+        mse = hpi_mse(property_listings, target)
+    return math.sqrt(mse)
+
+
+def hpi_mse_batch(
+    property_listings: pd.DataFrame,
+    available_values: np.ndarray,
+    target: str = "price",
+) -> np.ndarray:
+    """
+    This is a batched version of `hpi_mse`, meant for comparing several candidate
+    values of the *available* home price index (e.g. when backtesting corrections
+    to the 3-month lag) on the same property listings.
+
+    This method expects a `DataFrame` `property_listings` with the following columns:
+    - `price`, the sale price (only needed when `target` is `price`), and
+    - `trueValueHomePriceIndex`, the value of the home price index on the month of
+      the sale,
+    and an array `available_values` of shape `(K, N)`, where `N` is the number of
+    property listings, each row of which is a candidate for the value of the home
+    price index *available* on the month of each sale.
+
+    It returns an array of shape `(K,)` containing, for each of these `K` candidates,
+    the mean squared error inherent to using it instead of the *true* home price index.
+
     The `target` argument is either `price` or `logPrice`, depending on whether
     the error in prices or log-prices is to be computed.
     """
-    return np.sqrt(hpi_mse(property_listings, target))
+    # See `hpi_mse` for the expressions of the errors. The one-dimensional arrays
+    # `price` and `true_value` are broadcast against each row of `available_values`.
+    available_value = np.asarray(available_values, dtype=np.float64)
+    true_value = property_listings["trueValueHomePriceIndex"].to_numpy(dtype=np.float64)
+    if target == "logPrice":
+        price = None
+        expression = "sum(log(t / a) ** 2, axis=1)"
+    else:
+        price = property_listings["price"].to_numpy(dtype=np.float64, na_value=np.nan)
+        expression = "sum((p * (1 - a / t)) ** 2, axis=1)"
+
+    if true_value.size == 0:
+        return np.full(available_value.shape[0], np.nan)
+
+    if numexpr is not None:
+        sum_squared_errors = numexpr.evaluate(
+            expression, local_dict={"p": price, "a": available_value, "t": true_value}
+        )
+        return sum_squared_errors / true_value.size
+
+    if target == "logPrice":
+        errors = np.log(true_value / available_value)
+    else:
+        errors = price * (1 - available_value / true_value)
+    return np.einsum("ij,ij->i", errors, errors) / true_value.size
 
 
 def cv_evaluation(  # pylint: disable=too-many-locals, too-many-arguments
@@ -69,6 +166,7 @@ def cv_evaluation(  # pylint: disable=too-many-locals, too-many-arguments
     n_splits: int = 5,
     seed: int = 2026,
     hyperparameters: dict = None,
+    n_jobs: int = -1,
     **kwargs,
 ) -> tuple[float, float, list[models.Model]]:
     """
@@ -79,6 +177,10 @@ def cv_evaluation(  # pylint: disable=too-many-locals, too-many-arguments
     the data into, and `seed`, an integer which is used as the random seed for
     the random splitting.
 
+    The folds are trained and evaluated in parallel, using `n_jobs` processes
+    (following the `joblib` convention: `-1` means using all the available cores
+    and `1` means running the folds sequentially).
+
     Returns
     train_cv_mse    Average mean squared error over the training folds.
     test_cv_mse     Average mean squared error over the testing folds.
@@ -96,30 +198,80 @@ def cv_evaluation(  # pylint: disable=too-many-locals, too-many-arguments
         KFold(n_splits=n_splits, shuffle=True, random_state=seed).split(features)
     )
 
-    # Train and evaluate the models
-    trained_models = []
-    squared_errors = np.zeros(shape=(n_splits, 2))
-    for fold_number, (train_indices, test_indices) in enumerate(fold_indices):
-
-        # Training
-        model = model_class(**hyperparameters)
-        trained_models.append(model)
-        model.fit(features.iloc[train_indices], target.iloc[train_indices])
+    # Convert the data to `numpy` arrays once, so that each fold is then extracted
+    # via plain `numpy` indexing instead of via `DataFrame.iloc`.
+    feature_values = _numeric_values(features)
+    target_values = target.to_numpy()
+    # In that case only the values and the labels of `features` are sent to each job,
+    # rather than the whole `DataFrame` as well.
+    feature_labels = (features.index, features.columns)
+    if feature_values is not None:
+        features = None
 
-        # Evaluation
-        train_mse = model.evaluate(
-            features.iloc[train_indices], target.iloc[train_indices], **kwargs
-        )
-        test_mse = model.evaluate(
-            features.iloc[test_indices], target.iloc[test_indices], **kwargs
+    # Train and evaluate the models, one fold per job
+    model_hyperparameters = _avoid_oversubscription(
+        model_class, hyperparameters, n_jobs
+    )
+    results = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_run_fold)(
+            model_class,
+            model_hyperparameters,
+            features,
+            feature_values,
+            feature_labels,
+            target_values,
+            train_indices,
+            test_indices,
+            **kwargs,
         )
-        squared_errors[fold_number] = train_mse, test_mse
-
+        for train_indices, test_indices in fold_indices
+    )
+    trained_models = [model for model, _, _ in results]
+    squared_errors = np.array(
+        [(train_mse, test_mse) for _, train_mse, test_mse in results]
+    )
     train_cv_mse, test_cv_mse = squared_errors.mean(axis=0)
 
     return train_cv_mse, test_cv_mse, trained_models
 
 
+def _run_fold(  # pylint: disable=too-many-locals, too-many-arguments
+    model_class: models.Model,
+    hyperparameters: dict,
+    features: pd.DataFrame,
+    feature_values: np.ndarray,
+    feature_labels: tuple[pd.Index, pd.Index],
+    target_values: np.ndarray,
+    train_indices: np.ndarray,
+    test_indices: np.ndarray,
+    **kwargs,
+) -> tuple[models.Model, float, float]:
+    """
+    Train a model on a single cross-validation fold, and evaluate it on both
+    the training and testing parts of that fold. This is called via `cv_evaluation`.
+
+    Either `features` or `feature_values` is `None` (see `_take_rows`), and
+    `feature_labels` holds the index and the columns of the features.
+
+    Returns the trained model, the training mean squared error, and
+    the testing mean squared error.
+    """
+    # Extract the training and testing data once, and reuse them below
+    train_features = _take_rows(features, feature_values, feature_labels, train_indices)
+    test_features = _take_rows(features, feature_values, feature_labels, test_indices)
+    train_target = target_values[train_indices]
+    test_target = target_values[test_indices]
+
+    # Training
+    model = model_class(**hyperparameters)
+    model.fit(train_features, train_target)
+
+    # Evaluation
+    train_mse = model.evaluate(train_features, train_target, **kwargs)
+    test_mse = model.evaluate(test_features, test_target, **kwargs)
+    return model, train_mse, test_mse
+
+
 def run_experiment(  # pylint: disable=too-many-arguments
     features: pd.DataFrame,
     target: pd.DataFrame,
@@ -127,13 +279,17 @@ def run_experiment(  # pylint: disable=too-many-arguments
     hyperparameters: dict,
     n_experiments: int,
     n_splits: int,
-) -> dict:
+    seed: int = None,
+    n_jobs: int = -1,
+) -> pd.DataFrame:
     """
     Given a model class, hyperparameters, and experiment parameters, train models
     of that class and with these parameters. The experiment parameters are `n_splits`
     and `n_experiments`, which set the number of cross-validation folds and the number
     of experiments to run, respectively.
 
+    The experiments are independent from one another and are run in parallel.
+
     Arguments
     features                The inputs of the model.
     target                  The true target outputs.
@@ -144,29 +300,118 @@ def run_experiment(  # pylint: disable=too-many-arguments
     n_experiments           The number of experiments to run (each will use a random
                             seed for splitting the data into cross-validation folds).
     n_splits                The number of cross-validation folds used.
+    seed                    The random seed from which the seeds of the individual
+                            experiments are drawn. If `None`, fresh entropy is used.
+    n_jobs                  The number of experiments run in parallel (following the
+                            `joblib` convention: `-1` means using all the available
+                            cores and `1` means running the experiments sequentially).
 
     Returns
-    record                  A dictionary whose keys are the hyperparameters,
-                            experiment parameters, and experiment result names and
-                            the values are their corresponding values.
-    """
-    experiment_parameters = {"n_splits": n_splits, "seed": None}
-    for _ in range(n_experiments):
-        experiment_parameters["seed"] = secrets.randbits(32)
-        train_cv_mse, test_cv_mse, _ = cv_evaluation(
-            model_class,
+    records                 A `DataFrame` with one row per experiment, whose columns
+                            are the hyperparameters, experiment parameters, and
+                            experiment result names and the values are their
+                            corresponding values.
+    """
+    # Draw all the seeds upfront, so that the experiments are reproducible
+    # given `seed` regardless of the order in which they are run.
+    seeds = np.random.default_rng(seed).integers(2**32, size=n_experiments)
+    records = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_run_single_experiment)(
             features,
             target,
-            **experiment_parameters,
-            hyperparameters=hyperparameters,
+            model_class,
+            hyperparameters,
+            n_splits,
+            int(experiment_seed),
+            n_jobs,
         )
-        experiment_result = {
-            "train_cv_mse": train_cv_mse,
-            "test_cv_mse": test_cv_mse,
-        }
-        record = {
-            **experiment_parameters,
-            **hyperparameters,
-            **experiment_result,
-        }
-    return record
+        for experiment_seed in seeds
+    )
+    return pd.DataFrame(records)
+
+
+def _run_single_experiment(  # pylint: disable=too-many-arguments
+    features: pd.DataFrame,
+    target: pd.DataFrame,
+    model_class: models.Model,
+    hyperparameters: dict,
+    n_splits: int,
+    seed: int,
+    n_jobs: int,
+) -> dict:
+    """
+    Run a single cross-validation experiment. This is called via `run_experiment`,
+    where `n_jobs` is the number of experiments run in parallel.
+
+    Returns a dictionary whose keys are the hyperparameters, experiment parameters,
+    and experiment result names and the values are their corresponding values.
+    """
+    experiment_parameters = {"n_splits": n_splits, "seed": seed}
+    # The experiments themselves already run in parallel,
+    # hence the folds of each experiment are run sequentially.
+    train_cv_mse, test_cv_mse, _ = cv_evaluation(
+        model_class,
+        features,
+        target,
+        **experiment_parameters,
+        hyperparameters=_avoid_oversubscription(model_class, hyperparameters, n_jobs),
+        n_jobs=1,
+    )
+    experiment_result = {
+        "train_cv_mse": train_cv_mse,
+        "test_cv_mse": test_cv_mse,
+    }
+    return {
+        **experiment_parameters,
+        **hyperparameters,
+        **experiment_result,
+    }
+
+
+def _avoid_oversubscription(
+    model_class: models.Model, hyperparameters: dict, n_jobs: int
+) -> dict:
+    """
+    When several models are trained in parallel (i.e. when `n_jobs` is not 1),
+    `xgboost` is restricted to a single thread, unless the `hyperparameters`
+    specify otherwise, to avoid oversubscribing the cores.
+
+    Returns the hyperparameters to be passed to `model_class`.
+    """
+    if n_jobs != 1 and model_class is models.BoostedTrees:
+        return {"n_jobs": 1, **hyperparameters}
+    return hyperparameters
+
+
+def _numeric_values(data: pd.DataFrame) -> np.ndarray:
+    """
+    Return the values of the `DataFrame` `data` as a single `float64` `numpy` array
+    if all of its columns are numeric (or boolean), and `None` otherwise.
+    The missing values of nullable columns (`pd.NA`) are converted to NaN.
+    """
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in data.dtypes):
+        return data.to_numpy(dtype=np.float64, na_value=np.nan)
+    return None
+
+
+def _take_rows(
+    data: pd.DataFrame,
+    values: np.ndarray,
+    labels: tuple[pd.Index, pd.Index],
+    indices: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Extract the rows at the positions `indices` of the features, which are given
+    either as the `DataFrame` `data` or as the `numpy` array `values`.
+
+    If `values` is not `None` then it is expected to be the output of
+    `_numeric_values` (and `data` is not needed): the rows are then extracted from that
+    `numpy` array and wrapped, without copy, in a `DataFrame` whose index and columns
+    are given by `labels`. Otherwise this falls back to `data.iloc[indices]`.
+    """
+    if values is None:
+        return data.iloc[indices]
+    index, columns = labels
+    return pd.DataFrame(
+        values[indices], index=index[indices], columns=columns, copy=False
+    )
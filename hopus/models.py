@@ -9,8 +9,6 @@ from sklearn.metrics import mean_squared_error
 import numpy as np
 import pandas as pd
 
-from xgboost import XGBRegressor as _XGBRegressor
-
 
 class Model(ABC):
     """
@@ -76,12 +74,39 @@ class Baseline(Model):
     def _fit(self, features):
         """
         Fit the baseline mode. This is called via `Baseline.fit`.
+
+        This is a thin adapter which extracts the two columns used by the baseline model
+        and passes them, as `numpy` arrays, to `Baseline.fit_arrays`.
         """
-        self._zipcode_averages = features.groupby("zipCode").agg(
-            meanTimeNormalizedPricePerSqFtInZipcode=(
-                "timeNormalizedPricePerSqFt",
-                "mean",
-            )
+        self.fit_arrays(
+            features["zipCode"].to_numpy(),
+            _contiguous_values(features["timeNormalizedPricePerSqFt"]),
+        )
+
+    def fit_arrays(self, zipcodes: np.ndarray, values: np.ndarray):
+        """
+        Fit the baseline model directly from `numpy` arrays, namely the ZIP code
+        `zipcodes` and the time-normalized price-per-square-foot `values` of
+        each listing. This lets callers which already hold these arrays skip
+        the `DataFrame` overhead of `Baseline.fit`.
+
+        The means over each ZIP code are computed by encoding the ZIP codes as integers
+        and then summing, and counting, the values for each integer code via
+        `np.bincount`, which is a single pass over the data.
+        Missing ZIP codes and missing values are ignored, as in `DataFrame.groupby`.
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        codes, zipcodes = pd.factorize(zipcodes, sort=True)
+        is_valid = (codes >= 0) & ~np.isnan(values)
+        sums = np.bincount(
+            codes[is_valid], weights=values[is_valid], minlength=len(zipcodes)
+        )
+        counts = np.bincount(codes[is_valid], minlength=len(zipcodes))
+        with np.errstate(invalid="ignore"):
+            means = sums / counts
+        self._zipcode_averages = pd.DataFrame(
+            {"meanTimeNormalizedPricePerSqFtInZipcode": means},
+            index=pd.Index(zipcodes, name="zipCode"),
         )
 
     def predict(self, features, target_type="price", **kwargs):
@@ -100,38 +125,69 @@ class Baseline(Model):
         if target_type not in ("price", "log_price"):
             raise ValueError("The `target_type` must be either `price` or `log_price`.")
 
-        merged_features = pd.merge(
-            features, self._zipcode_averages, on="zipCode", how="left"
-        )
-        merged_features["predictedPrice"] = (
-            merged_features["meanTimeNormalizedPricePerSqFtInZipcode"]
-            * merged_features["predictedValueHomePriceIndex"]
-            * merged_features["sqFt"]
+        # Look up the mean (over its ZIP code) corresponding to each listing.
+        # Each ZIP code is converted to its position in the index of the means and
+        # the means are then gathered with a single `numpy` indexing operation.
+        # Unknown ZIP codes have position -1, which points to a trailing NaN.
+        zipcode_averages = self._zipcode_averages[
+            "meanTimeNormalizedPricePerSqFtInZipcode"
+        ]
+        positions = zipcode_averages.index.get_indexer(features["zipCode"])
+        zipcode_means = np.append(zipcode_averages.to_numpy(dtype=np.float64), np.nan)
+        # The prediction is computed in a single output buffer, without intermediate
+        # arrays (the first product allocates that buffer).
+        # The columns are made C-contiguous first: a column of a `DataFrame` built
+        # from a 2D array (e.g. in `evaluation.cv_evaluation`) is a strided view.
+        prediction = np.multiply(
+            zipcode_means[positions],
+            _contiguous_values(features["predictedValueHomePriceIndex"]),
         )
+        np.multiply(prediction, _contiguous_values(features["sqFt"]), out=prediction)
 
         # If the target type is `price`, return the prediction
         if target_type == "price":
-            return merged_features["predictedPrice"]
+            return pd.Series(prediction, index=features.index, name="predictedPrice")
 
         # Otherwise, compute the predicted log-price and return that
-        merged_features["predictedLogPrice"] = np.log(merged_features["predictedPrice"])
-        return merged_features["predictedLogPrice"]
+        np.log(prediction, out=prediction)
+        return pd.Series(prediction, index=features.index, name="predictedLogPrice")
 
     def save(self, filename: str):
         """
         Save the model by saving the means, over each ZIP code, of the time-normalized
         price-per-square-foot. Since that data is stored internally as a `pandas`
-        `DataFramed` it is saved as a `csv` file.
+        `DataFramed` it is saved either as a `parquet` file, if `filename` has
+        the `.parquet` extension, or as a `csv` file otherwise.
+
+        The `parquet` format is faster to write and read and preserves the types
+        of the columns, but it requires `pyarrow`.
         """
-        self._zipcode_averages.to_csv(filename)
+        if str(filename).endswith(".parquet"):
+            self._zipcode_averages.to_parquet(filename, compression="zstd")
+        else:
+            self._zipcode_averages.to_csv(filename)
 
     def load(self, filename: str):
         """
         Load the model by loading the means, over each ZIP code, of the time-normalized
-        price-per-square-foot. That data is expected to be stored externally as a `csv`
-        file and is then loaded and stored internally as a `pandas` `DataFrame`.
+        price-per-square-foot. That data is expected to be stored externally as
+        a `parquet` file, if `filename` has the `.parquet` extension, or as a `csv`
+        file otherwise. It is then stored internally as a `pandas` `DataFrame`.
+
+        When reading a `csv` file, the types of the columns are specified
+        (rather than inferred) and match those produced by `Baseline.fit`.
         """
-        self._zipcode_averages = pd.read_csv(filename)
+        if str(filename).endswith(".parquet"):
+            self._zipcode_averages = pd.read_parquet(filename)
+            return
+        self._zipcode_averages = pd.read_csv(
+            filename,
+            index_col="zipCode",
+            dtype={
+                "zipCode": np.int64,
+                "meanTimeNormalizedPricePerSqFtInZipcode": np.float64,
+            },
+        )
 
 
 class LinearRegression(Model):
@@ -173,17 +229,25 @@ class LinearRegression(Model):
         Load the model by loading its parameters (the coefficients and the intercept)
         which are expected to be stored as numpy arrays in a single `npz` file.
         """
-        parameters = np.load(filename)
-        self._model.coef_ = parameters["coefficients"]
-        self._model.intercept = parameters["intercept"]
+        with np.load(filename) as parameters:
+            self._model.coef_ = parameters["coefficients"]
+            self._model.intercept_ = parameters["intercept"]
 
 
 class BoostedTrees(Model):
     """This is a thin wrapper around the 'XGBRegressor' of the 'xgboost' library."""
 
     def __init__(self, **hyperparameters):
-        """Initialize a 'BoostedTrees' object."""
-        self._model = _XGBRegressor(**hyperparameters)
+        """
+        Initialize a 'BoostedTrees' object.
+
+        The `xgboost` library is only imported here (rather than at the top of
+        this module), since importing it is slow and is not needed by the other models.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from xgboost import XGBRegressor
+
+        self._model = XGBRegressor(**hyperparameters)
 
     def fit(self, features, target):
         """
@@ -193,9 +257,44 @@ class BoostedTrees(Model):
         self._model.fit(features, target)
 
     def predict(self, features, **kwargs):
-        """Returns a prediction obtained by mapping the features through the model."""
+        """
+        Returns a prediction obtained by mapping the features through the model.
+
+        When all the features are numeric (or boolean), they are passed to `xgboost`
+        as a single C-contiguous `float32` `numpy` array, which is the type `xgboost`
+        uses internally. This skips the column-by-column conversion of
+        the `DataFrame` and yields the same predictions. The missing values of nullable
+        columns (`pd.NA`) are converted to NaN, which `xgboost` treats as missing.
+
+        Since a `numpy` array has no column names, the columns of `features` are first
+        checked against the feature names the model was trained with (as `xgboost`
+        does for a `DataFrame`), and a `ValueError` is raised if they differ.
+        """
+        if isinstance(features, pd.DataFrame) and all(
+            pd.api.types.is_numeric_dtype(dtype) for dtype in features.dtypes
+        ):
+            trained_names = self._model.get_booster().feature_names
+            names = _xgboost_feature_names(features)
+            if trained_names is not None and names != list(trained_names):
+                raise ValueError(
+                    "The columns of `features` do not match the features "
+                    "the model was trained with."
+                )
+            features = np.ascontiguousarray(
+                features.to_numpy(dtype=np.float32, na_value=np.nan)
+            )
         return self._model.predict(features)
 
+    def predict_dmatrix(self, dmatrix):
+        """
+        Returns a prediction obtained by mapping the features, already converted to
+        an `xgboost.DMatrix` (e.g. via `xgboost.DMatrix(features)`), through the model.
+
+        This is useful when predicting repeatedly from the same features, since
+        the conversion of the features to a `DMatrix` then only happens once.
+        """
+        return self._model.get_booster().predict(dmatrix)
+
     def save(self, filename: str):
         """
         Save the model by using the built-in save function from `xgboost`.
@@ -207,3 +306,21 @@ class BoostedTrees(Model):
         Load the model by using the built-in load function from `xgboost`.
         """
         self._model.load_model(filename)
+
+
+def _contiguous_values(column: pd.Series) -> np.ndarray:
+    """
+    Return the values of `column` as a C-contiguous `float64` `numpy` array.
+    No copy is made if these values already have that layout and type.
+    """
+    return np.ascontiguousarray(column.to_numpy(dtype=np.float64))
+
+
+def _xgboost_feature_names(features: pd.DataFrame) -> list:
+    """
+    Return the feature names `xgboost` derives from the columns of `features`
+    (the levels of `MultiIndex` columns are joined by spaces).
+    """
+    if isinstance(features.columns, pd.MultiIndex):
+        return [" ".join(str(level) for level in column) for column in features.columns]
+    return [str(column) for column in features.columns]
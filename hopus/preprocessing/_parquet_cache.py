@@ -0,0 +1,125 @@
+"""
+This module contains a helper used to cache data loaded from text files
+(`csv` or `json`), possibly after pre-processing it, as `parquet` files,
+which are much faster to read. It also records whether `pyarrow` (which is needed
+to read and write `parquet` files) is installed, for the other loaders to use.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Whether `pyarrow` is installed, in which case its multi-threaded `csv` and `json`
+# parsers are used to read the text files
+HAS_PYARROW = pyarrow is not None
+CSV_ENGINE = "pyarrow" if HAS_PYARROW else "c"
+
+# The names of the attributes (see `pd.DataFrame.attrs`, which are stored in
+# the `parquet` file) listing the columns whose values are stored as `json` strings,
+# and the categorical columns along with their categories
+_JSON_COLUMNS = "jsonColumns"
+_CATEGORICAL_COLUMNS = "categoricalColumns"
+
+
+def load_with_parquet_cache(
+    path, load: Callable[[], pd.DataFrame], suffix: str = ".parquet", dependencies=()
+) -> pd.DataFrame:
+    """
+    Load the data stored in the file `path` by calling `load`, unless that data was
+    already cached.
+
+    The cache is a `parquet` file stored next to `path`, with the same name but with
+    the extension `suffix`. It is used as long as it is more recent than `path`
+    and than any of the other files listed in `dependencies` (e.g. other files read
+    by `load`), and it is (re)written otherwise. If the cache cannot be written
+    (e.g. because the directory is read-only), the data is simply returned
+    without being cached.
+
+    Note that the columns containing nested records (dictionaries or lists, such as
+    the `features` of property listings) are stored in the cache as `json` strings
+    and are decoded when the cache is read. Storing them as `parquet` structures
+    would instead give all the dictionaries of a column all the keys found in that
+    column (e.g. one key per year in the `taxAssessments` of the listings), which is
+    both inexact and very slow to read back. Similarly, the categories of
+    the categorical columns are recorded in the cache and restored when it is read,
+    since `parquet` only preserves the categories of string columns.
+    """
+    source = Path(str(path))
+    cache = source.with_suffix(suffix)
+    last_modified = max(
+        Path(str(file)).stat().st_mtime for file in (source, *dependencies)
+    )
+    if cache.exists() and cache.stat().st_mtime >= last_modified:
+        return _decode_json_columns(pd.read_parquet(cache))
+
+    data = load()
+    try:
+        _encode_json_columns(data).to_parquet(cache, compression="zstd")
+    except OSError:
+        # The cache is merely an optimization, so failing to write it is not an error
+        cache.unlink(missing_ok=True)
+    return data
+
+
+def _encode_json_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of `data` in which the columns containing dictionaries or lists
+    are encoded as `json` strings. These columns, as well as the categorical columns
+    and their categories, are listed in the `attrs` of the returned `DataFrame`.
+
+    Columns whose nested values are not `json`-serializable (e.g. those read
+    by `pyarrow`, which contain `numpy` arrays) are left unchanged and are stored
+    as `parquet` structures, from which such values come in the first place.
+    """
+    encoded_columns = {}
+    for column in data.columns:
+        if data[column].dtype != object or not isinstance(
+            data[column].dropna().head(1).squeeze(), (dict, list)
+        ):
+            continue
+        try:
+            encoded_columns[column] = data[column].map(json.dumps, na_action="ignore")
+        except TypeError:
+            continue
+    categorical_columns = {}
+    for column in data.columns:
+        if isinstance(data[column].dtype, pd.CategoricalDtype):
+            categories = data[column].cat.categories.tolist()
+            try:
+                json.dumps(categories)
+            except TypeError:
+                continue
+            categorical_columns[column] = {
+                "categories": categories,
+                "ordered": bool(data[column].cat.ordered),
+            }
+    encoded_data = data.assign(**encoded_columns)
+    encoded_data.attrs[_JSON_COLUMNS] = list(encoded_columns)
+    encoded_data.attrs[_CATEGORICAL_COLUMNS] = categorical_columns
+    return encoded_data
+
+
+def _decode_json_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Decode, in-place, the `json` strings of the columns listed in the `attrs` of
+    `data`, and restore the categories of its categorical columns
+    (see `_encode_json_columns`). Return `data`.
+    """
+    for column in data.attrs.pop(_JSON_COLUMNS, []):
+        # Missing values are restored as `None`, as they are in the loaded data
+        values = data[column].to_numpy(dtype=object, na_value=None)
+        data[column] = pd.Series(
+            [None if value is None else json.loads(value) for value in values],
+            index=data.index,
+            dtype=object,
+        )
+    for column, dtype in data.attrs.pop(_CATEGORICAL_COLUMNS, {}).items():
+        data[column] = data[column].astype(pd.CategoricalDtype(**dtype))
+    return data
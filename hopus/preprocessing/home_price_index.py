@@ -2,19 +2,62 @@
 This module contains the methods used to load and pre-process the home price index data.
 """
 
+from functools import lru_cache
 from importlib import resources
+import os
 
+import numpy as np
 import pandas as pd
 
+from ._parquet_cache import CSV_ENGINE, load_with_parquet_cache
 
-def load_demo_data(path: str = None) -> pd.DataFrame:
+
+def load_demo_data(path: str = None, use_cache: bool = False) -> pd.DataFrame:
     """
     Load the raw home price index data from a `csv` file
     into a `pandas` `DataFrame`.
+
+    Only the two columns used, namely the date and the value of the index,
+    are parsed. Their types are specified (rather than inferred) and
+    the dates are parsed directly while reading the file.
+
+    Within a session, the parsed `csv` file is memoized (see `_read_csv`), so that
+    loading the same, unmodified, file again does not parse it again. A copy of
+    the memoized data is returned since `preprocess` modifies the data in-place.
+
+    If `use_cache` is `True`, the loaded data is cached as a `parquet` file next to
+    the `csv` file, and subsequent loads read that cache instead (this requires
+    `pyarrow`). See `_parquet_cache.load_with_parquet_cache` for details.
     """
     if path is None:
         path = resources.files("hopus").joinpath("demo/CSUSHPINSA.csv")
-    return pd.read_csv(path)
+
+    def load() -> pd.DataFrame:
+        return _read_csv(str(path), os.path.getmtime(path)).copy()
+
+    if use_cache:
+        return load_with_parquet_cache(path, load)
+    return load()
+
+
+@lru_cache(maxsize=8)
+def _read_csv(path: str, modification_time: float) -> pd.DataFrame:
+    """
+    Read the raw home price index data from the `csv` file `path`.
+
+    The result is memoized, and the `modification_time` of the file is part of
+    the key of the memoized results so that a file modified on disk is read again.
+    The returned `DataFrame` is shared between calls and must not be modified.
+    """
+    # pylint: disable=unused-argument
+    return pd.read_csv(
+        path,
+        engine=CSV_ENGINE,
+        usecols=["observation_date", "CSUSHPINSA"],
+        dtype={"CSUSHPINSA": "float64"},
+        parse_dates=["observation_date"],
+        date_format="%Y-%m-%d",
+    )
 
 
 def preprocess(data: pd.DataFrame) -> None:
@@ -31,6 +74,8 @@ def preprocess(data: pd.DataFrame) -> None:
     4. Combine the `availableValue` and a seasonal adjustment to make a prediction
        for the home price index value.
        See the documentation in `_compute_seasonal_adjustment` for details.
+    5. Store all the values as single-precision floating-point numbers.
+       See the documentation in `_downcast_values` for details.
 
     All these steps happen in-place.
     """
@@ -38,6 +83,7 @@ def preprocess(data: pd.DataFrame) -> None:
     _convert_date_type(data)
     _add_three_month_lagged_value(data)
     _compute_seasonal_adjustment(data)
+    _downcast_values(data)
 
 
 def _rename_columns(data: pd.DataFrame, columns=None) -> None:
@@ -57,7 +103,8 @@ def _rename_columns(data: pd.DataFrame, columns=None) -> None:
 
 def _convert_date_type(data: pd.DataFrame) -> None:
     """
-    Convert the type of the `data` column to be a `datetime` object,
+    Convert the type of the `data` column to be a `datetime` object
+    (unless it already is, e.g. when the data is loaded via `load_demo_data`),
     then keep only the month and the year of that data,
     and finally set that column to be the index of the `DataFrame`.
 
@@ -65,7 +112,7 @@ def _convert_date_type(data: pd.DataFrame) -> None:
 
     All of this is done in-place.
     """
-    data["date"] = pd.to_datetime(data["date"])
+    data["date"] = pd.to_datetime(data["date"], format="%Y-%m-%d", cache=True)
     data["date"] = data["date"].dt.to_period("M")
     data.set_index("date", inplace=True)
 
@@ -88,7 +135,8 @@ def _add_three_month_lagged_value(data: pd.DataFrame):
         availableValue(month M) = trueValue(month M-3).
 
     Moreover, we then remove all rows for which it is not possible to compute
-    the `availableValue`, namely the first three rows, in chronological order.
+    the `availableValue`, namely the first three rows, in chronological order
+    (as well as any row with a missing value, should the index be missing a month).
     Since the home price index goes back to January 1987, this does not cause
     any issues as long as we only consider real estate transactions that occur
     during, or after, April 1987.
@@ -96,6 +144,8 @@ def _add_three_month_lagged_value(data: pd.DataFrame):
     These operations is carried out in-place.
     """
     data["availableValue"] = data["trueValue"].shift(3)
+    # Missing values are dropped (rather than only the first three rows) so that
+    # a value missing from the series does not propagate to the seasonal adjustment
     data.dropna(how="any", inplace=True)
 
 
@@ -116,9 +166,37 @@ def _compute_seasonal_adjustment(data: pd.DataFrame):
 
     This is done in-place.
     """
-    data["trueMinusAvailable"] = data["trueValue"] - data["availableValue"]
-    grouped_by_month = data.groupby(data.index.month)
-    data["monthAvgTrueMinusAvailable"] = grouped_by_month[
-        "trueMinusAvailable"
-    ].transform("mean")
-    data["predictedValue"] = data["availableValue"] + data["monthAvgTrueMinusAvailable"]
+    # The whole computation is carried out on `numpy` arrays, and the three resulting
+    # columns are only assigned to the `DataFrame` at the end
+    available_value = data["availableValue"].to_numpy(dtype=np.float64)
+    true_minus_available = data["trueValue"].to_numpy(dtype=np.float64)
+    true_minus_available = true_minus_available - available_value
+    # There are only 12 months, so the averages for each month are computed by
+    # summing, and counting, the differences in each month via `np.bincount`
+    # (the bins are indexed by the month, from 1 to 12, and bin 0 is unused)
+    # The index has a monthly period, whose integer representation is the number of
+    # months since January 1970, so the month is computed with integer arithmetic
+    month = data.index.asi8 % 12 + 1
+    sums = np.bincount(month, weights=true_minus_available, minlength=13)
+    counts = np.bincount(month, minlength=13)
+    month_averages = sums / np.maximum(counts, 1)
+    month_average_per_row = month_averages[month]
+    data["trueMinusAvailable"] = true_minus_available
+    data["monthAvgTrueMinusAvailable"] = month_average_per_row
+    data["predictedValue"] = available_value + month_average_per_row
+
+
+def _downcast_values(data: pd.DataFrame) -> None:
+    """
+    The values of the home price index have (at most) six significant digits, so they
+    are stored as `float32` rather than `float64`. This halves the memory used by
+    the home price index columns, both here and once they are merged with
+    the property listings data.
+
+    The computations above are carried out in double precision and only their results
+    are downcast.
+
+    This is done in-place.
+    """
+    for column in data.columns:
+        data[column] = data[column].astype(np.float32)
@@ -4,20 +4,167 @@ obtained via the `properties` endpoints of the RentCast API
 (see https://developers.rentcast.io/reference/property-data).
 """
 
+from functools import lru_cache
 from importlib import resources
 
 import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_demo_data(path: str = None) -> pd.DataFrame:
+from . import home_price_index
+from ._parquet_cache import HAS_PYARROW, load_with_parquet_cache
+
+
+class _NonWordCharacterDeletion(dict):
+    """
+    A translation table, for `str.translate`, which deletes the non-word characters
+    (i.e. those matched by the regular expression `\\W`: all the characters except
+    the alphanumeric characters and the underscore) and keeps all other characters.
+
+    The table is filled lazily, as characters are encountered, so that translating
+    a string is a scan of a character table rather than a regular expression search.
+    """
+
+    def __missing__(self, codepoint: int):
+        character = chr(codepoint)
+        self[codepoint] = codepoint if character.isalnum() or character == "_" else None
+        return self[codepoint]
+
+
+_DELETE_NON_WORD_CHARACTERS = _NonWordCharacterDeletion()
+
+
+def load_demo_data(path: str = None, use_cache: bool = False) -> pd.DataFrame:
     """
     Load the raw property listings data from the `json` file obtained from the RentCast
     API into a `pandas` `DataFrame`.
+
+    Files with the `.jsonl` or `.ndjson` extension are expected to be line-delimited,
+    i.e. to contain one listing per line. See `_read_json` for details.
+
+    If `use_cache` is `True`, the loaded data is cached as a `parquet` file next to
+    the `json` file, and subsequent loads read that cache instead (this requires
+    `pyarrow`). See `_parquet_cache.load_with_parquet_cache` for details.
+    """
+    if path is None:
+        path = resources.files("hopus").joinpath("demo/data_v1.json")
+    if use_cache:
+        return load_with_parquet_cache(path, lambda: _read_json(path))
+    return _read_json(path)
+
+
+def load_preprocessed_demo_data(
+    path: str = None, home_price_index_path: str = None, use_cache: bool = False
+) -> pd.DataFrame:
+    """
+    Load the raw property listings data (see `load_demo_data`) and the raw home price
+    index data (see `home_price_index.load_demo_data`), pre-process both, and
+    return the pre-processed property listings data (see `preprocess`).
+
+    If `use_cache` is `True`, the pre-processed data is cached as a `parquet` file
+    next to the property listings `json` file (with the `.preprocessed.parquet`
+    extension), and subsequent loads read that cache instead, skipping
+    the pre-processing entirely (this requires `pyarrow`). The cache is refreshed
+    whenever either input file is modified, but it must be deleted by hand after
+    the pre-processing steps themselves are modified.
+    See `_parquet_cache.load_with_parquet_cache` for details.
     """
     if path is None:
         path = resources.files("hopus").joinpath("demo/data_v1.json")
-    return pd.read_json(path)
+    if home_price_index_path is None:
+        home_price_index_path = resources.files("hopus").joinpath("demo/CSUSHPINSA.csv")
+
+    def load() -> pd.DataFrame:
+        home_price_index_data = home_price_index.load_demo_data(home_price_index_path)
+        home_price_index.preprocess(home_price_index_data)
+        return preprocess(load_demo_data(path), home_price_index_data)
+
+    if not use_cache:
+        return load()
+    return load_with_parquet_cache(
+        path,
+        load,
+        suffix=".preprocessed.parquet",
+        dependencies=[home_price_index_path],
+    )
+
+
+def _read_json(path) -> pd.DataFrame:
+    """
+    Read the `json` file `path` into a `pandas` `DataFrame`, as `pd.read_json` does.
+
+    When `orjson` is installed, it is used to parse the file, which is several times
+    faster than the parser used by `pd.read_json`. The `DataFrame` is then built
+    directly from the parsed data, whose row labels (the keys of the inner objects)
+    are converted back to integers, and whose columns are converted to numbers
+    (see `_convert_numeric_columns`), as `pd.read_json` does. The columns therefore
+    have the same types whether `orjson` is installed or not.
+
+    Line-delimited files (with the `.jsonl` or `.ndjson` extension) are read with
+    the multi-threaded `json` reader of `pyarrow`, when it is installed, and
+    with `pd.read_json(path, lines=True)` otherwise. The columns read by `pyarrow` are
+    converted to numbers as `pd.read_json` does, as well. Note that `pyarrow` requires
+    nested records to share a common structure, hence the dictionaries
+    (such as the `features`) contain all the keys found in their column,
+    with `None` for the missing ones.
+    """
+    if str(path).endswith((".jsonl", ".ndjson")):
+        if not HAS_PYARROW:
+            return pd.read_json(path, lines=True)
+        # pylint: disable-next=import-outside-toplevel
+        from pyarrow import json as pyarrow_json
+
+        data = pyarrow_json.read_json(path).to_pandas()
+        _convert_numeric_columns(data)
+        return data
+    if orjson is None:
+        return pd.read_json(path)
+    with open(path, "rb") as file:
+        parsed = orjson.loads(file.read())  # pylint: disable=no-member
+    data = pd.DataFrame(parsed)
+    if isinstance(parsed, dict):
+        try:
+            data.index = data.index.astype("int64")
+        except ValueError:
+            pass
+    _convert_numeric_columns(data)
+    return data
+
+
+def _convert_numeric_columns(data: pd.DataFrame) -> None:
+    """
+    Convert, in-place, the columns of `data` to numbers as `pd.read_json` does
+    (with its default `dtype=True`).
+    - The columns of strings which all represent numbers (e.g. ZIP codes such as
+      `"02134"`) are converted to `float64`.
+    - The floating-point columns, and the columns of mixed types, whose values are
+      all integers are then converted to `int64`.
+    The other columns (e.g. those containing dictionaries) are left unchanged.
+    """
+    for column in data.columns:
+        values = data[column]
+        converted = False
+        # (missing values may be `None` or NaN, depending on the parser)
+        if pd.api.types.infer_dtype(values, skipna=True) == "string":
+            try:
+                values = values.astype("float64")
+                converted = True
+            except (TypeError, ValueError):
+                pass
+        if len(values) and values.dtype in (np.float64, object):
+            try:
+                integer_values = values.astype("int64")
+                if (integer_values == values).all():
+                    values = integer_values
+                    converted = True
+            except (TypeError, ValueError, OverflowError):
+                pass
+        if converted:
+            data[column] = values
 
 
 def preprocess(
@@ -49,24 +196,28 @@ def preprocess(
     13. Compute the 'time-normalized price-per-square-foot' (obtained by dividing
         the price-per-square-foot by the current value of the home price index).
     14. Compute the logarithms of the sale prices.
+    15. Store the `zipCode` as a categorical variable, downcast some numeric columns
+        to single precision or to small integers, and consolidate the columns
+        in memory (see `_consolidate_columns`).
 
     Once all the steps are carried out, the modified `property_listings`
     `DataFrame` is returned.
     """
-    # Step 1
-    _focus_in_single_family_homes(property_listings_data)
-    # Step 2
-    _drop_listings_with_missing_sizes(property_listings_data)
-    # Step 3
-    _reset_index_after_dropping_rows(property_listings_data)
+    # Steps 1, 2, and 3 (carried out together, in a single pass over the data)
+    property_listings_data = _keep_rows(
+        property_listings_data,
+        _is_single_family_home(property_listings_data)
+        & _has_known_sizes(property_listings_data),
+    )
+    del property_listings_data["propertyType"]
     # Step 4
     _rename_columns(property_listings_data)
     # Step 5
     property_listings_data = _expand_features(property_listings_data)
-    # Step 6
-    _remove_listings_with_high_unit_count(property_listings_data)
-    # Step 7
-    _reset_index_after_dropping_rows(property_listings_data)
+    # Steps 6 and 7 (carried out together, in a single pass over the data)
+    property_listings_data = _keep_rows(
+        property_listings_data, ~_has_high_unit_count(property_listings_data)
+    )
     # Step 8
     _fill_missing_numeric_values_with_zeroes(property_listings_data)
     # Step 9
@@ -83,7 +234,8 @@ def preprocess(
     _compute_time_normalized_price_per_square_foot(property_listings_data)
     # Step 14
     _compute_log_price(property_listings_data)
-    return property_listings_data
+    # Step 15
+    return _consolidate_columns(property_listings_data)
 
 
 def drop_outliers(data: pd.DataFrame, cutoff: tuple[float, float] = (0.2, 2.0)) -> None:
@@ -104,13 +256,11 @@ def drop_outliers(data: pd.DataFrame, cutoff: tuple[float, float] = (0.2, 2.0))
     This is done in-place and the index is reset after the rows are dropped.
     """
     low_cutoff, high_cutoff = cutoff
-    data.drop(
-        data[
-            (data["timeNormalizedPricePerSqFt"] < low_cutoff)
-            | (data["timeNormalizedPricePerSqFt"] > high_cutoff)
-        ].index,
-        inplace=True,
+    time_normalized_price_per_square_foot = data["timeNormalizedPricePerSqFt"]
+    is_outlier = (time_normalized_price_per_square_foot < low_cutoff) | (
+        time_normalized_price_per_square_foot > high_cutoff
     )
+    data.drop(data.index[is_outlier.to_numpy()], inplace=True)
     _reset_index_after_dropping_rows(data)
 
 
@@ -123,23 +273,17 @@ def drop_missing_key_features(
 
     This is done inplace and the index is reset after the rows are dropped.
     """
-    if column_to_group_map_path is None:
-        column_to_group_map_path = resources.files("hopus").joinpath(
-            "config/column_to_group_map.csv"
-        )
-
-    column_to_group_map = pd.read_csv(column_to_group_map_path)
-    column_to_group_map = dict(
-        zip(column_to_group_map["Key"], column_to_group_map["Value"])
-    )
-    for column in data.columns:
-        if (
-            column in column_to_group_map
-            and column_to_group_map[column] == "keyPredictionFeatures"
-            and (column + "_nan") in data.columns
-        ):
-            data.drop(data[data[column + "_nan"] == 1].index, inplace=True)
-            del data[column + "_nan"]
+    column_to_group_map = _load_column_to_group_map(column_to_group_map_path)
+    sentinel_columns = [
+        column + "_nan"
+        for column in data.columns
+        if column_to_group_map.get(column) == "keyPredictionFeatures"
+        and (column + "_nan") in data.columns
+    ]
+    # Drop, in a single call, the rows missing at least one key feature
+    # and the sentinel columns of the key features
+    is_missing = data[sentinel_columns].to_numpy(dtype=bool).any(axis=1)
+    data.drop(index=data.index[is_missing], columns=sentinel_columns, inplace=True)
     _reset_index_after_dropping_rows(data)
 
 
@@ -159,42 +303,60 @@ def group_columns(data: pd.DataFrame, column_to_group_map_path: str = None) -> N
 
     This is done in-place.
     """
+    # Build the multi_index_map
+    multi_index_map = _load_column_to_group_map(column_to_group_map_path)
+    data.columns = pd.MultiIndex.from_arrays(
+        [[multi_index_map[column] for column in data.columns], data.columns]
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_column_to_group_map(column_to_group_map_path: str = None) -> dict:
+    """
+    Load the map which takes a column name to a category (see `group_columns`) from
+    the `csv` file `column_to_group_map_path` and return it as a dictionary.
+    By default, the `csv` file shipped with HOPUS is used.
+
+    The result is cached, so that the `csv` file is parsed at most once per path.
+    The returned dictionary is therefore shared and must not be modified.
+    """
     if column_to_group_map_path is None:
         column_to_group_map_path = resources.files("hopus").joinpath(
             "config/column_to_group_map.csv"
         )
-
-    # Build the multi_index_map
     column_to_group_map = pd.read_csv(column_to_group_map_path)
-    multi_index_map = dict(
-        zip(column_to_group_map["Key"], column_to_group_map["Value"])
-    )
-    data.columns = pd.MultiIndex.from_arrays(
-        [[multi_index_map[column] for column in data.columns], data.columns]
-    )
+    return dict(zip(column_to_group_map["Key"], column_to_group_map["Value"]))
 
 
-def _focus_in_single_family_homes(data: pd.DataFrame) -> None:
+def _is_single_family_home(data: pd.DataFrame) -> pd.Series:
     """
-    Remove listings whose `propertyType` is not `Single Family`,
-    i.e. remove listings that are not single-family homes.
+    Return a boolean mask indicating which listings have `Single Family`
+    as their `propertyType`, i.e. which listings are single-family homes.
+    """
+    return data["propertyType"] == "Single Family"
 
-    The column `propertyType` is also removed,
-    since it now trivial and no longer needed.
 
-    This is done in-place.
+def _has_known_sizes(data: pd.DataFrame) -> pd.Series:
     """
-    data.drop(data[data["propertyType"] != "Single Family"].index, inplace=True)
-    del data["propertyType"]
+    Return a boolean mask indicating which listings have both
+    their `squareFootage` and their `lotSize` entries.
+    """
+    return data["squareFootage"].notna() & data["lotSize"].notna()
 
 
-def _drop_listings_with_missing_sizes(data: pd.DataFrame) -> None:
+def _keep_rows(data: pd.DataFrame, mask: pd.Series) -> pd.DataFrame:
     """
-    Remove listings whose `squareFootage` or `lotSize` entry is missing.
+    Return a new `DataFrame` containing only the rows of `data` selected by
+    the boolean `mask`, with its index reset so that there are no gaps in indexing.
 
-    This is done in-place.
+    Filtering all at once with a combined `mask` copies the data a single time,
+    instead of once per filtering criterion. That single copy is a positional gather
+    of the selected rows, and the fresh index is then assigned directly
+    (`reset_index` would copy the data a second time on older versions of `pandas`).
     """
-    data.dropna(subset=["squareFootage", "lotSize"], how="any", inplace=True)
+    kept_rows = data.take(np.flatnonzero(mask))
+    kept_rows.index = pd.RangeIndex(len(kept_rows))
+    return kept_rows
 
 
 def _reset_index_after_dropping_rows(data: pd.DataFrame) -> None:
@@ -203,8 +365,7 @@ def _reset_index_after_dropping_rows(data: pd.DataFrame) -> None:
     This is convenient to do after dropping rows from the `DataFrame`
     since it removes any gaps in the indexing of the `DataFrame`.
     """
-    data.reset_index(inplace=True)
-    del data["index"]
+    data.reset_index(drop=True, inplace=True)
 
 
 def _rename_columns(data: pd.DataFrame, columns=None) -> None:
@@ -234,28 +395,87 @@ def _expand_features(data: pd.DataFrame) -> pd.DataFrame:
     in its stead, one-hot encoded columns of the form `features_exteriorType_Brick` and
     `features_roofType_Slate` are created.
 
+    The `features` column is removed from `data` in-place (rather than by copying
+    all the other columns into a new `DataFrame`), and the expanded features are
+    then joined to the remaining columns with a single concatenation.
+
     Once all of this is done, the updated `data` `DataFrame` is returned.
     """
-    # `pd.get_dummies` automatically detects which columns contain numeric data and
-    # it leaves these columns unmodified.
-    features = pd.get_dummies(pd.json_normalize(data["features"]), dummy_na=True)
-    # Remove non-alphanumeric characters from the resulting column names
-    features.columns = features.columns.str.replace(r"\W", "", regex=True)
-    features = features.add_prefix("features_")
-    data = pd.concat([data, features], axis=1)
-    del features, data["features"]
-    return data
+    features = _one_hot_encode(_flatten_features(data.pop("features")))
+    # Remove non-alphanumeric characters from the resulting column names,
+    # and add the `features_` prefix, in a single pass over the column names
+    features.columns = [
+        "features_" + column.translate(_DELETE_NON_WORD_CHARACTERS)
+        for column in features.columns
+    ]
+    return pd.concat([data, features], axis=1)
+
+
+def _flatten_features(features: pd.Series) -> pd.DataFrame:
+    """
+    Flatten the `features` `Series`, whose entries are (flat) dictionaries, or `None`
+    for the listings without features, into a `DataFrame` with one column per key,
+    as `pd.json_normalize` does.
+
+    The dictionaries are walked once, filling one list of values per key, and
+    the type of each column is then inferred from its list of values.
+    The columns appear in the order in which their keys are first encountered.
+    """
+    columns = {}
+    for row, listing_features in enumerate(features.to_numpy()):
+        if not isinstance(listing_features, dict):
+            continue
+        for key, value in listing_features.items():
+            if key not in columns:
+                columns[key] = [None] * len(features)
+            columns[key][row] = value
+    return pd.DataFrame(columns, index=features.index)
+
+
+def _one_hot_encode(features: pd.DataFrame) -> pd.DataFrame:
+    """
+    One-hot encode the non-numeric columns of the `features` `DataFrame`, as
+    `pd.get_dummies(features, dummy_na=True)` does, except that a `_nan` indicator
+    column is only created for the features which are actually missing for
+    some listings (otherwise that column would be identically zero).
+
+    The numeric columns are left unmodified and come first, followed by
+    the one-hot encoded columns, named and ordered as by `pd.get_dummies`.
+
+    Each column is encoded from its integer codes (see `pd.factorize`) by a single
+    comparison against all of its categories, and all the one-hot encoded columns
+    are stored in a single boolean array, rather than being built one at a time.
+    """
+    categorical_columns = features.select_dtypes(
+        include=["object", "string", "category"]
+    ).columns
+    numeric_columns = features.columns.difference(categorical_columns, sort=False)
+    names = []
+    one_hot_blocks = [np.zeros((len(features), 0), dtype=bool)]
+    for column in categorical_columns:
+        codes, categories = pd.factorize(features[column], sort=True)
+        names.extend(f"{column}_{category}" for category in categories)
+        one_hot_blocks.append(codes[:, np.newaxis] == np.arange(len(categories)))
+        is_missing = codes < 0
+        if is_missing.any():
+            names.append(column + "_nan")
+            one_hot_blocks.append(is_missing[:, np.newaxis])
+    one_hot = pd.DataFrame(
+        np.concatenate(one_hot_blocks, axis=1), index=features.index, columns=names
+    )
+    return pd.concat([features[numeric_columns], one_hot], axis=1)
 
 
-def _remove_listings_with_high_unit_count(data: pd.DataFrame) -> None:
+def _has_high_unit_count(data: pd.DataFrame) -> pd.Series:
     """
     The newly created `features_unitCount` column sometimes contains values
     greater than 1. This indicates that the home is not used as a single-family homes,
     and so such homes are dropped from the data.
 
-    This is done in-place.
+    This returns a boolean mask which is `True` for the listings to drop
+    (see `_keep_rows`). Listings with a missing `features_unitCount` are kept.
     """
-    data.drop(data[data["features_unitCount"] > 1].index, inplace=True)
+    return data["features_unitCount"] > 1
 
 
 def _fill_missing_numeric_values_with_zeroes(
@@ -278,8 +498,14 @@ def _fill_missing_numeric_values_with_zeroes(
             "features_garageSpaces",
             "features_roomCount",
         ]
-    data[[column + "_nan" for column in numeric_columns]] = data[numeric_columns].isna()
-    data.fillna(value={column: 0 for column in numeric_columns}, inplace=True)
+    # The numeric columns are read once, as a single `numpy` array, from which both
+    # the sentinel columns and the filled columns are computed.
+    # The sentinel columns are stored as `bool` (one byte per entry) and both sets
+    # of columns are written back at once, each as a single block.
+    values = data[numeric_columns].to_numpy(dtype=np.float64)
+    is_missing = np.isnan(values)
+    data[[column + "_nan" for column in numeric_columns]] = is_missing
+    data[numeric_columns] = np.where(is_missing, 0.0, values)
 
 
 def _fill_missing_year_built_with_median(data: pd.DataFrame) -> None:
@@ -292,8 +518,11 @@ def _fill_missing_year_built_with_median(data: pd.DataFrame) -> None:
 
     This is done in-place.
     """
-    data["yearBuilt_nan"] = data["yearBuilt"].isna()
-    data.fillna(value={"yearBuilt": data["yearBuilt"].median()}, inplace=True)
+    year_built = data["yearBuilt"].to_numpy(dtype=np.float64, copy=True)
+    is_missing = np.isnan(year_built)
+    data["yearBuilt_nan"] = is_missing
+    year_built[is_missing] = np.nanmedian(year_built)
+    data["yearBuilt"] = year_built
 
 
 def _convert_sale_date_type(data: pd.DataFrame) -> None:
@@ -303,19 +532,31 @@ def _convert_sale_date_type(data: pd.DataFrame) -> None:
 
     This is done in-place.
     """
-    data["saleDate"] = pd.to_datetime(data["saleDate"])
-    data["saleDate"] = data["saleDate"].dt.tz_localize(None)
-    data["saleDate"] = data["saleDate"].dt.to_period("M")
+    # The RentCast API returns ISO 8601 timestamps in UTC,
+    # e.g. `2024-08-01T00:00:00.000Z`, so the format need not be inferred
+    sale_date = pd.to_datetime(data["saleDate"], utc=True, format="ISO8601", cache=True)
+    # The timestamps are truncated to their month by a single `numpy` cast, and
+    # the resulting number of months since January 1970 is exactly the integer
+    # representation of a monthly `pd.Period` (missing dates are preserved)
+    sale_month = sale_date.dt.tz_convert(None).to_numpy().astype("datetime64[M]")
+    data["saleDate"] = pd.arrays.PeriodArray(
+        sale_month.view(np.int64), dtype=pd.PeriodDtype("M")
+    )
 
 
 def _split_sale_date(data: pd.DataFrame) -> None:
     """
     Split the sale date into two pieces: the month and the year.
 
+    Since the sale date is a monthly `pd.Period`, it is stored as the number of months
+    elapsed since January 1970, from which the month and year are directly computed.
+
     This is done in-place.
     """
-    data["saleMonth"] = data["saleDate"].dt.month
-    data["saleYear"] = data["saleDate"].dt.year
+    months_since_year_zero = data["saleDate"].array.asi8 + 1970 * 12
+    sale_year, sale_month = np.divmod(months_since_year_zero, 12)
+    data["saleMonth"] = sale_month + 1
+    data["saleYear"] = sale_year
 
 
 def _merge_with_home_price_index_data(
@@ -323,16 +564,13 @@ def _merge_with_home_price_index_data(
 ) -> pd.DataFrame:
     """
     Merge the property listings data and the home price index data using the date
-    of sale as key on which to join these two DataFrames.
+    of sale as key on which to join these two DataFrames. Since the home price index
+    data is indexed by date, this is done via an index-based `DataFrame.join`.
 
     Returned the merged `DataFrame`.
     """
-    return pd.merge(
-        left=property_listings_data,
-        right=home_price_index_data.add_suffix("HomePriceIndex"),
-        left_on="saleDate",
-        right_index=True,
-        how="inner",
+    return property_listings_data.join(
+        home_price_index_data.add_suffix("HomePriceIndex"), on="saleDate", how="inner"
     )
 
 
@@ -358,3 +596,43 @@ def _compute_log_price(data: pd.DataFrame) -> None:
     This is done in-place.
     """
     data["logPrice"] = np.log(data["price"])
+
+
+def _consolidate_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    After columns have been added one at a time, `pandas` stores the `data` `DataFrame`
+    as many separate blocks of memory. Here these are consolidated: all the columns
+    sharing a same `dtype` are stored in a single column-major block, so that each
+    column is contiguous in memory and so that converting the numeric columns to
+    a 2D `numpy` array (e.g. when training a model) does not require interleaving
+    many blocks.
+
+    Moreover, before consolidating the data, some columns are stored more compactly:
+    - the `zipCode`, which only takes a handful of distinct values, is stored as
+      a `category`, and
+    - the `sqFt` and the `timeNormalizedPricePerSqFt` are stored as `float32`
+      (the former is a whole number and the latter is only used to detect outliers
+      and as a per-ZIP-code average in `models.Baseline`),
+    - the counts (of bedrooms, floors, garage spaces, and rooms), whose missing values
+      were replaced by zeroes in `_fill_missing_numeric_values_with_zeroes`,
+      are stored as `int16`, and
+    - the `bathrooms` (which can be a half-integer) and the `yearBuilt` (whose
+      missing values were replaced by a median, which can be a half-integer)
+      are stored as `float32`, which represents these values exactly.
+
+    The consolidated `DataFrame` is returned.
+    """
+    data = data.astype(
+        {
+            "zipCode": "category",
+            "sqFt": np.float32,
+            "timeNormalizedPricePerSqFt": np.float32,
+            "bedrooms": np.int16,
+            "bathrooms": np.float32,
+            "features_floorCount": np.int16,
+            "features_garageSpaces": np.int16,
+            "features_roomCount": np.int16,
+            "yearBuilt": np.float32,
+        }
+    )
+    return data.copy()